@@ -0,0 +1,331 @@
+"""_sync_lib.py - Shared code for the marketplace version sync scripts.
+
+Used by sync-versions.py (submodule layout, plugins next to marketplace.json)
+and sync_marketplace_versions.py (plugins located from each entry's source).
+Both read plugin versions the same way, from the first of:
+- .claude-plugin/plugin.json (standard Claude Code plugin)
+- pyproject.toml (Python projects)
+- package.json (Node.js projects)
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11: fall back to the regex below
+    tomllib = None
+
+# version = "..." line in pyproject.toml, for when tomllib is unavailable
+_PYPROJECT_VERSION_RE = re.compile(r'^\s*version\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+
+# Per-plugin version caches live in .git, keyed by the manifests' stat
+# stamps. Each script passes its own file name: they key plugins by
+# different paths and prune the cache to their own plugins.
+# Manifests modified this recently are not cached: a later edit within the
+# same timestamp tick could keep the stamp unchanged (git's racy-clean rule)
+_RACY_WINDOW_NS = 2_000_000_000
+_VERSION_SOURCES = (
+    os.path.join(".claude-plugin", "plugin.json"),
+    "pyproject.toml",
+    "package.json",
+)
+
+
+def load_marketplace_json(start_path: Path) -> tuple[Path, dict[str, Any] | None] | None:
+    """Find and load marketplace.json from its common locations.
+
+    Each candidate is read directly instead of exists() then open, so the
+    first hit costs one open. Returns None if there is no marketplace.json,
+    and (path, None) if the one found could not be parsed (error printed).
+    """
+    candidates = [
+        start_path / ".claude-plugin" / "marketplace.json",
+        start_path / "marketplace.json",
+    ]
+    for candidate in candidates:
+        try:
+            content = candidate.read_bytes()
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except OSError as e:
+            print(f"Error loading {candidate}: {e}", file=sys.stderr)
+            return candidate, None
+        try:
+            return candidate, json.loads(content)
+        except json.JSONDecodeError as e:
+            print(f"Error loading {candidate}: {e}", file=sys.stderr)
+            return candidate, None
+    return None
+
+
+def load_json(path: Path) -> dict[str, Any] | None:
+    """Load and parse a JSON file."""
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Error loading {path}: {e}", file=sys.stderr)
+        return None
+
+
+def save_json(path: Path, data: dict[str, Any]) -> bool:
+    """Save data to a JSON file with pretty formatting.
+
+    Written to a temp file next to it and renamed into place, so an
+    interrupted run never leaves a truncated marketplace.json behind.
+    Identical contents are not rewritten, keeping the file's mtime stable.
+    """
+    # Serialize in one call and write once, rather than streaming json.dump
+    # chunks through a text file
+    content = (json.dumps(data, indent=2) + "\n").encode("utf-8")
+    try:
+        if path.read_bytes() == content:
+            return True
+    except OSError:
+        pass  # Missing or unreadable: just write it
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        print(f"Error saving {path}: {e}", file=sys.stderr)
+        return False
+
+
+def get_pyproject_version(content: bytes) -> str | None:
+    """Get the version from pyproject.toml contents.
+
+    Parsed with tomllib so only [project] (or [tool.poetry]) versions count;
+    the regex is a fallback for old Pythons and files tomllib rejects.
+    """
+    if tomllib is not None:
+        try:
+            data = tomllib.loads(content.decode("utf-8"))
+        except (UnicodeDecodeError, tomllib.TOMLDecodeError):
+            pass
+        else:
+            # Valid TOML can still hold a non-table where a table is expected
+            # (e.g. project = "x"), so check each level
+            project = data.get("project")
+            version = project.get("version") if isinstance(project, dict) else None
+            if not version:
+                tool = data.get("tool")
+                poetry = tool.get("poetry") if isinstance(tool, dict) else None
+                version = poetry.get("version") if isinstance(poetry, dict) else None
+            return version if isinstance(version, str) else None
+
+    # Simple regex to extract version from [project] section
+    match = _PYPROJECT_VERSION_RE.search(content.decode("utf-8", "replace"))
+    if match:
+        return match.group(1)
+    return None
+
+
+def get_json_version(content: bytes) -> str | None:
+    """Get the top-level version from plugin.json/package.json contents."""
+    version = json.loads(content).get("version")
+    return version or None
+
+
+def get_source_version(plugin_dir: Path, source: str) -> str | None:
+    """Get the version from one of the _VERSION_SOURCES of a plugin.
+
+    The file is opened directly (a missing file is just an OSError), so
+    there is no separate exists() stat. Broken JSON is reported.
+    """
+    path = plugin_dir / source
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+
+    if source == "pyproject.toml":
+        return get_pyproject_version(content)
+    try:
+        return get_json_version(content)
+    except json.JSONDecodeError as e:
+        print(f"Error loading {path}: {e}", file=sys.stderr)
+        return None
+
+
+def get_plugin_version(plugin_dir: Path) -> str | None:
+    """Get the version from a plugin directory.
+
+    Sources are tried in _VERSION_SOURCES order and the first version found
+    wins; later sources are not touched at all.
+    """
+    for source in _VERSION_SOURCES:
+        version = get_source_version(plugin_dir, source)
+        if version:
+            return version
+    return None
+
+
+def get_file_stamp(path: Path) -> list[int] | None:
+    """Return [mtime_ns, ctime_ns, inode, size] of a file, or None if missing.
+
+    ctime and inode catch edits that restore the mtime (cp -p, rsync, utime)
+    or replace the file.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_ctime_ns, st.st_ino, st.st_size]
+
+
+def get_manifest_stamp(plugin_dir: Path, count: int) -> list:
+    """Return the file stamps of the first `count` version sources."""
+    return [get_file_stamp(plugin_dir / source) for source in _VERSION_SOURCES[:count]]
+
+
+def get_cached_plugin_version(plugin_dir: Path, cache: dict[str, Any]) -> str | None:
+    """Get the plugin version, reusing the cached one if no manifest changed.
+
+    Stat-ing the sources is cheaper than opening and parsing them, and on
+    most runs (e.g. every pre-commit) none of them has changed. Only the
+    sources up to the one that had the version are stamped, so a plugin.json
+    hit costs a single stat. Only found versions are cached, so broken
+    manifests are reported on every run, and neither are manifests changed
+    in the last couple of seconds.
+    """
+    key = str(plugin_dir)
+    entry = cache.get(key)
+    if (
+        isinstance(entry, list)
+        and len(entry) == 2
+        and isinstance(entry[0], list)
+        and entry[0] == get_manifest_stamp(plugin_dir, len(entry[0]))
+    ):
+        return entry[1]
+
+    cache.pop(key, None)
+    stamp = []
+    for source in _VERSION_SOURCES:
+        # Stat before reading, so a write in between invalidates the entry
+        stamp.append(get_file_stamp(plugin_dir / source))
+
+        version = get_source_version(plugin_dir, source)
+        if version:
+            racy_after = time.time_ns() - _RACY_WINDOW_NS
+            if all(st is None or max(st[0], st[1]) < racy_after for st in stamp):
+                cache[key] = [stamp, version]
+            return version
+    return None
+
+
+def load_version_cache(cache_path: Path | None) -> dict[str, Any]:
+    """Load the version cache; a missing or corrupt cache is just empty."""
+    if cache_path is None:
+        return {}
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_version_cache(cache_path: Path, cache: dict[str, Any]) -> None:
+    """Write the version cache atomically."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def list_subdirs(path: Path) -> set[str]:
+    """Return the names of the directories directly inside `path`."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name for entry in it if entry.is_dir()}
+    except OSError:
+        return set()
+
+
+def locate_plugins(
+    marketplace_dir: Path,
+    plugins: list[dict[str, Any]],
+    use_sources: bool = True,
+) -> list[tuple[dict[str, Any], Path, bool]]:
+    """Resolve each marketplace entry to its local plugin directory.
+
+    With use_sources=False every plugin is expected at
+    <marketplace_dir>/<name> (submodule layout). Otherwise the entry's
+    source decides: "./path" strings are relative to the marketplace, and
+    github/url sources are looked up in OUTPUT_SKILLS/ (or the parent's).
+
+    Returns (plugin, plugin_dir, found) for every named plugin, in order.
+    Each candidate location is listed once instead of an exists() per plugin.
+    """
+    local_dirs = list_subdirs(marketplace_dir)
+    output_skills_dir = marketplace_dir / "OUTPUT_SKILLS"
+    parent_output_skills_dir = marketplace_dir.parent / "OUTPUT_SKILLS"
+    if use_sources:
+        output_skills = list_subdirs(output_skills_dir)
+        parent_output_skills = list_subdirs(parent_output_skills_dir)
+
+    targets: list[tuple[dict[str, Any], Path, bool]] = []
+    for plugin in plugins:
+        plugin_name = plugin.get("name", "")
+        if not plugin_name:
+            continue
+
+        source = plugin.get("source", f"./{plugin_name}") if use_sources else None
+        if isinstance(source, str) and source.startswith("./"):
+            # Path-based source (legacy): plugin dir is relative to marketplace
+            plugin_dir = marketplace_dir / source[2:]
+            found = plugin_dir.exists()
+        elif isinstance(source, dict) and source.get("source") in ("github", "url"):
+            # URL-based source: look in OUTPUT_SKILLS/ for local dev copy
+            plugin_dir = output_skills_dir / plugin_name
+            found = plugin_name in output_skills
+            if not found:
+                # Also try parent's OUTPUT_SKILLS (if marketplace_dir is a subdirectory)
+                plugin_dir = parent_output_skills_dir / plugin_name
+                found = plugin_name in parent_output_skills
+        else:
+            plugin_dir = marketplace_dir / plugin_name
+            found = plugin_name in local_dirs
+        targets.append((plugin, plugin_dir, found))
+
+    return targets
+
+
+def read_plugin_versions(repo_root: Path, plugin_dirs: list[Path], cache_name: str) -> dict[Path, str | None]:
+    """Read the version of every plugin directory.
+
+    Manifest reads are I/O-bound and each touches its own files, so they
+    run concurrently. Unchanged manifests are answered from the cache file
+    <repo_root>/.git/<cache_name> (plain clones only; worktrees and
+    submodules skip it).
+    """
+    git_dir = repo_root / ".git"
+    cache_path = git_dir / cache_name if git_dir.is_dir() else None
+    old_cache = load_version_cache(cache_path)
+    cache = dict(old_cache)
+
+    workers = min(32, (os.cpu_count() or 1) * 4, len(plugin_dirs)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        read_version = functools.partial(get_cached_plugin_version, cache=cache)
+        versions = dict(zip(plugin_dirs, executor.map(read_version, plugin_dirs)))
+
+    # Keep only the current plugins and skip the write when nothing changed
+    new_cache = {key: cache[key] for key in map(str, plugin_dirs) if key in cache}
+    if cache_path is not None and new_cache != old_cache:
+        save_version_cache(cache_path, new_cache)
+
+    return versions
@@ -11,10 +11,14 @@ Usage:
 """
 
 import argparse
+import functools
+import io
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TextIO
 
 # ANSI Colors
 GREEN = "\033[0;32m"
@@ -24,22 +28,45 @@ BLUE = "\033[0;34m"
 NC = "\033[0m"
 
 
+@functools.lru_cache(maxsize=None)
 def check_git_cliff() -> bool:
     """Check if git-cliff is installed."""
     return shutil.which("git-cliff") is not None
 
 
-def generate_changelog(repo_path: Path, name: str = "repo") -> bool:
+def is_changelog_modified(repo_path: Path) -> bool:
+    """Check if CHANGELOG.md differs from the index."""
+    status = subprocess.run(
+        ["git", "diff", "--quiet", "CHANGELOG.md"],
+        cwd=repo_path,
+        capture_output=True,
+        timeout=30
+    )
+    return status.returncode != 0
+
+
+def generate_changelog(repo_path: Path, name: str = "repo", out: TextIO | None = None) -> bool:
     """Generate CHANGELOG.md for a repository.
 
+    Progress messages go to `out` (stdout by default), so parallel runs can
+    buffer them and print each repo's lines together.
+
     Returns True if changelog was updated, False if unchanged or error.
     """
     cliff_toml = repo_path / "cliff.toml"
     if not cliff_toml.exists():
-        print(f"{YELLOW}⚠{NC} {name}: No cliff.toml found, skipping")
+        print(f"{YELLOW}⚠{NC} {name}: No cliff.toml found, skipping", file=out)
         return False
 
-    print(f"{BLUE}→{NC} Generating CHANGELOG.md for {name}...")
+    print(f"{BLUE}→{NC} Generating CHANGELOG.md for {name}...", file=out)
+
+    # Snapshot the current contents so the change check below is a byte
+    # comparison instead of a `git diff --quiet` subprocess
+    changelog = repo_path / "CHANGELOG.md"
+    try:
+        before = changelog.read_bytes()
+    except FileNotFoundError:
+        before = None
 
     result = subprocess.run(
         ["git-cliff", "-o", "CHANGELOG.md"],
@@ -50,42 +77,45 @@ def generate_changelog(repo_path: Path, name: str = "repo") -> bool:
     )
 
     if result.returncode != 0:
-        print(f"{RED}✘{NC} {name}: git-cliff failed: {result.stderr}")
+        print(f"{RED}✘{NC} {name}: git-cliff failed: {result.stderr}", file=out)
         return False
 
     # Check if changelog changed
-    status = subprocess.run(
-        ["git", "diff", "--quiet", "CHANGELOG.md"],
-        cwd=repo_path,
-        capture_output=True,
-        timeout=30
-    )
+    try:
+        after = changelog.read_bytes()
+    except FileNotFoundError:
+        after = None
 
-    if status.returncode != 0:
-        print(f"{GREEN}✓{NC} {name}: CHANGELOG.md updated")
+    if after != before:
+        print(f"{GREEN}✓{NC} {name}: CHANGELOG.md updated", file=out)
         return True
     else:
-        print(f"{GREEN}✓{NC} {name}: CHANGELOG.md unchanged")
+        print(f"{GREEN}✓{NC} {name}: CHANGELOG.md unchanged", file=out)
         return False
 
 
+def generate_changelog_buffered(target: tuple[str, Path]) -> tuple[bool, str]:
+    """Run generate_changelog for a (name, path) target, capturing its output."""
+    name, path = target
+    buf = io.StringIO()
+    return generate_changelog(path, name, out=buf), buf.getvalue()
+
+
 def commit_changelog(repo_path: Path, name: str = "repo") -> bool:
-    """Commit the updated CHANGELOG.md."""
-    # Check if there are changes
-    status = subprocess.run(
-        ["git", "diff", "--quiet", "CHANGELOG.md"],
-        cwd=repo_path,
-        capture_output=True,
-        timeout=30
-    )
+    """Commit the updated CHANGELOG.md.
 
-    if status.returncode == 0:
-        return False  # No changes
+    git-cliff can rewrite the file back to its committed contents, so the
+    change is confirmed with git before committing. Only CHANGELOG.md is
+    committed, never anything else the user has staged.
+    """
+    if not is_changelog_modified(repo_path):
+        print(f"{GREEN}✓{NC} {name}: CHANGELOG.md has no changes to commit")
+        return False
 
     # Stage and commit
     subprocess.run(["git", "add", "CHANGELOG.md"], cwd=repo_path, timeout=30)
     result = subprocess.run(
-        ["git", "commit", "-m", "chore: Update CHANGELOG.md"],
+        ["git", "commit", "-m", "chore: Update CHANGELOG.md", "--", "CHANGELOG.md"],
         cwd=repo_path,
         capture_output=True,
         text=True,
@@ -136,13 +166,9 @@ def main() -> int:
     print(f"{BLUE}{'=' * 50}{NC}")
     print()
 
-    updated = []
+    targets = [("main repo", repo_root)]
 
-    # Generate for main repo
-    if generate_changelog(repo_root, "main repo"):
-        updated.append(("main repo", repo_root))
-
-    # Generate for submodules if --all
+    # Add submodules if --all
     if args.all:
         submodules = [
             "perfect-skill-suggester",
@@ -150,15 +176,24 @@ def main() -> int:
         ]
         for submodule in submodules:
             submodule_path = repo_root / submodule
-            if submodule_path.exists() and (submodule_path / ".git").exists():
-                if generate_changelog(submodule_path, submodule):
-                    updated.append((submodule, submodule_path))
-            elif submodule_path.exists():
-                # Submodule might be using worktree (check for .git file)
-                git_file = submodule_path / ".git"
-                if git_file.is_file():
-                    if generate_changelog(submodule_path, submodule):
-                        updated.append((submodule, submodule_path))
+            # .git is a directory for regular clones and a file for
+            # submodules/worktrees; exists() covers both with a single stat
+            if (submodule_path / ".git").exists():
+                targets.append((submodule, submodule_path))
+
+    # Each repo is independent, so run git-cliff for all of them at once.
+    # Output is buffered per repo and printed in target order.
+    updated = []
+    with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+        results = executor.map(generate_changelog_buffered, targets)
+        for (name, path), (changed, output) in zip(targets, results):
+            print(output, end="")
+            if changed:
+                updated.append((name, path))
+            elif args.commit and is_changelog_modified(path):
+                # Not changed by this run, but left uncommitted by an
+                # earlier run without --commit
+                updated.append((name, path))
 
     # Commit if requested
     if args.commit and updated:
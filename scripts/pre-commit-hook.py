@@ -17,6 +17,9 @@ IMPORTANT: This hook is SKIPPED during:
 
 This prevents validation errors during history rewriting operations.
 
+Commits that only touch documentation (*.md, *.txt, *.rst, docs/**) run
+only the sensitive-data check, since docs can still leak secrets.
+
 To install as git hook:
     cp scripts/pre-commit-hook.py .git/hooks/pre-commit
     chmod +x .git/hooks/pre-commit
@@ -27,6 +30,7 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # ANSI Colors
@@ -36,6 +40,76 @@ YELLOW = "\033[1;33m"
 BLUE = "\033[0;34m"
 NC = "\033[0m"
 
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$")
+
+# Sensitive-data patterns, fused into one alternation so each diff line is
+# matched by a single compiled automaton instead of five re.search() calls
+_SENSITIVE_RE = re.compile(
+    r"password\s*[:=]"
+    r"|api[_-]?key\s*[:=]"
+    r"|secret\s*[:=]"
+    r"|(?P<token>token\s*[:=])"
+    r"|private[_-]?key",
+    re.IGNORECASE,
+)
+
+# A `token =` hit only counts when a long quoted literal follows it. That
+# tail is searched separately from the end of the match, so the fused
+# pattern has no `.*` to backtrack over long lines
+_TOKEN_VALUE_RE = re.compile(r"['\"][a-zA-Z0-9]{20,}['\"]")
+
+# Staged paths that can't affect manifests, hooks, code or versions
+_DOC_SUFFIXES = (".md", ".txt", ".rst")
+_DOC_DIR = "docs/"
+
+# Files sync-versions.py reads versions from; if none is staged it has
+# nothing new to compare
+_VERSION_FILES = ("plugin.json", "marketplace.json", "pyproject.toml", "package.json")
+
+# Every _SENSITIVE_RE alternative contains one of these literals, so a diff
+# that mentions none of them (lowercased) cannot match
+_SENSITIVE_KEYWORDS = ("password", "api", "secret", "token", "private")
+
+# Entries in the git dir that mark a history-rewriting operation
+_REBASE_INDICATORS = frozenset({
+    "rebase-merge",      # git rebase (interactive)
+    "rebase-apply",      # git rebase (non-interactive) / git am
+    "CHERRY_PICK_HEAD",  # git cherry-pick
+    "MERGE_HEAD",        # git merge in progress
+    "BISECT_LOG",        # git bisect
+})
+
+# Lines containing any of these (lowercased) are treated as placeholders
+_PLACEHOLDER_MARKERS = ("example", "placeholder", "your_", "<", "todo")
+
+# Runs validate_hook.py once per file inside a single interpreter, printing
+# one exit code per line. Passed to `uv run python -c` so the validator
+# still gets its own environment. Usage: <validator> <file>...
+# The codes go to a private copy of the original stdout while fd 1 is
+# pointed at stderr, so nothing the validator writes to fd 1 directly (or
+# from a subprocess) can shift the one-code-per-line protocol.
+_HOOK_BATCH_DRIVER = """
+import contextlib, io, os, runpy, sys
+results = os.fdopen(os.dup(1), "w")
+os.dup2(2, 1)
+script, paths = sys.argv[1], sys.argv[2:]
+sys.path.insert(0, os.path.dirname(script))
+for path in paths:
+    sys.argv = [script, path, "--quiet"]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            runpy.run_path(script, run_name="__main__")
+        code = 0
+    except SystemExit as e:
+        code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception:
+        code = 1
+    print(code, file=results, flush=True)
+"""
+
+# Seconds allowed per hooks.json in a batch run (the old per-file timeout)
+_HOOK_TIMEOUT_PER_FILE = 30
+
 
 def is_rebase_in_progress(git_dir: Path) -> bool:
     """Check if we're in the middle of a rebase or other history-rewriting operation.
@@ -43,18 +117,16 @@ def is_rebase_in_progress(git_dir: Path) -> bool:
     During rebase/cherry-pick/merge, commits are being replayed and we should
     skip validation to avoid conflicts and slowdowns.
     """
-    # Check for rebase indicators
-    rebase_indicators = [
-        git_dir / "rebase-merge",      # git rebase (interactive)
-        git_dir / "rebase-apply",       # git rebase (non-interactive) / git am
-        git_dir / "CHERRY_PICK_HEAD",   # git cherry-pick
-        git_dir / "MERGE_HEAD",         # git merge in progress
-        git_dir / "BISECT_LOG",         # git bisect
-    ]
-
-    for indicator in rebase_indicators:
-        if indicator.exists():
-            return True
+    # Check for rebase indicators. One directory listing answers all of
+    # them, instead of one stat per indicator.
+    try:
+        with os.scandir(git_dir) as it:
+            entries = {entry.name for entry in it}
+    except OSError:
+        entries = set()
+
+    if entries & _REBASE_INDICATORS:
+        return True
 
     # Also check environment variable (some git operations set this)
     if os.environ.get("GIT_AUTHOR_DATE"):
@@ -65,21 +137,28 @@ def is_rebase_in_progress(git_dir: Path) -> bool:
     return False
 
 
-def get_git_dir() -> Path:
-    """Get the .git directory path (handles both regular repos and submodules)."""
+def get_git_paths() -> tuple[Path, Path]:
+    """Get the repository root and .git directory in a single git call.
+
+    `git rev-parse` accepts several flags at once and prints one line per
+    flag, so both paths cost one process spawn instead of two. Handles both
+    regular repos and submodules (where the git dir lives under the parent).
+    """
     result = subprocess.run(
-        ["git", "rev-parse", "--git-dir"],
+        ["git", "rev-parse", "--show-toplevel", "--git-dir"],
         capture_output=True,
         text=True,
         timeout=10
     )
     if result.returncode == 0:
-        return Path(result.stdout.strip()).resolve()
+        lines = result.stdout.splitlines()
+        if len(lines) == 2:
+            return Path(lines[0]), Path(lines[1]).resolve()
     # Fallback
-    return Path(".git")
+    return Path.cwd(), Path(".git")
 
 
-def run_command(cmd: list[str], cwd: Path | None = None) -> tuple[int, str, str]:
+def run_command(cmd: list[str], cwd: Path | None = None, timeout: int = 30) -> tuple[int, str, str]:
     """Run a command and return exit code, stdout, stderr."""
     try:
         result = subprocess.run(
@@ -87,7 +166,7 @@ def run_command(cmd: list[str], cwd: Path | None = None) -> tuple[int, str, str]
             cwd=cwd,
             capture_output=True,
             text=True,
-            timeout=30
+            timeout=timeout
         )
         return result.returncode, result.stdout, result.stderr
     except Exception as e:
@@ -110,8 +189,7 @@ def get_staged_diff() -> str:
 
 def validate_semver(version: str) -> bool:
     """Validate semver format."""
-    pattern = r"^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$"
-    return bool(re.match(pattern, version))
+    return bool(_SEMVER_RE.match(version))
 
 
 def validate_marketplace_json(repo_root: Path) -> tuple[bool, str]:
@@ -132,8 +210,7 @@ def validate_marketplace_json(repo_root: Path) -> tuple[bool, str]:
 def validate_plugin_json(file_path: Path) -> tuple[bool, str]:
     """Validate a plugin.json file."""
     try:
-        with open(file_path) as f:
-            data = json.load(f)
+        data = json.loads(file_path.read_bytes())
     except json.JSONDecodeError as e:
         return False, f"invalid JSON: {e}"
 
@@ -150,36 +227,54 @@ def validate_plugin_json(file_path: Path) -> tuple[bool, str]:
     return True, ""
 
 
-def validate_hooks_json(file_path: Path, repo_root: Path) -> tuple[bool, str]:
-    """Validate a hooks.json file."""
+def validate_hooks_jsons(file_paths: list[Path], repo_root: Path) -> list[tuple[bool, str]]:
+    """Validate hooks.json files, returning one (passed, msg) per file.
+
+    All files go through a single `uv run` interpreter (see
+    _HOOK_BATCH_DRIVER) instead of one interpreter start per file.
+    """
     validator = repo_root / "OUTPUT_SKILLS" / "claude-plugins-validation" / "scripts" / "validate_hook.py"
 
+    if not file_paths:
+        return []
+
     if validator.exists():
-        code, _, _ = run_command(
-            ["uv", "run", "python", str(validator), str(file_path), "--quiet"],
-            cwd=repo_root / "OUTPUT_SKILLS" / "claude-plugins-validation"
+        _, stdout, _ = run_command(
+            ["uv", "run", "python", "-c", _HOOK_BATCH_DRIVER, str(validator)]
+            + [str(p) for p in file_paths],
+            cwd=repo_root / "OUTPUT_SKILLS" / "claude-plugins-validation",
+            # One budget per file, as when each ran in its own process
+            timeout=_HOOK_TIMEOUT_PER_FILE * len(file_paths)
         )
-        if code == 0:
-            return True, ""
-        return True, "has issues (non-blocking)"  # Non-blocking, still return True
+        # One exit code per line, in input order; files the driver never
+        # reported (crash, timeout, uv missing) count as failures
+        codes = stdout.split()
+        results = []
+        for i in range(len(file_paths)):
+            if i < len(codes) and codes[i] == "0":
+                results.append((True, ""))
+            else:
+                results.append((True, "has issues (non-blocking)"))  # Non-blocking, still return True
+        return results
 
     # Fallback: just check JSON validity
-    try:
-        with open(file_path) as f:
-            json.load(f)
-        return True, "JSON valid"
-    except json.JSONDecodeError:
-        return False, "invalid JSON"
+    results = []
+    for file_path in file_paths:
+        try:
+            json.loads(file_path.read_bytes())
+            results.append((True, "JSON valid"))
+        except json.JSONDecodeError:
+            results.append((False, "invalid JSON"))
+    return results
 
 
 def lint_python_files(files: list[str], repo_root: Path) -> tuple[bool, str]:
-    """Lint Python files with ruff."""
-    existing_files = [f for f in files if (repo_root / f).exists()]
-    if not existing_files:
+    """Lint Python files with ruff. Callers pass only files that exist."""
+    if not files:
         return True, "no files to lint"
 
     code, _, _ = run_command(
-        ["uv", "run", "ruff", "check"] + existing_files,
+        ["uv", "run", "ruff", "check"] + files,
         cwd=repo_root
     )
     if code == 0:
@@ -214,49 +309,100 @@ def check_version_consistency(repo_root: Path) -> tuple[bool, bool]:
 
 def check_sensitive_data(diff: str) -> bool:
     """Check for sensitive data patterns in diff."""
-    patterns = [
-        r"password\s*[:=]",
-        r"api[_-]?key\s*[:=]",
-        r"secret\s*[:=]",
-        r"token\s*[:=].*['\"][a-zA-Z0-9]{20,}['\"]",
-        r"private[_-]?key",
-    ]
+    # Clean diffs are the common case: a few substring scans rule most of
+    # them out, and one regex search over the whole text rules out the rest
+    # without iterating line by line (a bare `token =` still passes this)
+    lowered_diff = diff.lower()
+    if not any(k in lowered_diff for k in _SENSITIVE_KEYWORDS):
+        return False
+    if not _SENSITIVE_RE.search(diff):
+        return False
 
     for line in diff.split("\n"):
-        # Skip removed lines
-        if line.startswith("-"):
+        # Skip empty and removed lines
+        if not line or line[0] == "-":
             continue
-        # Skip obvious placeholders
-        if any(x in line.lower() for x in ["example", "placeholder", "your_", "<", "todo"]):
+        # Skip obvious placeholders (lowercase once per line, not per marker)
+        lowered = line.lower()
+        if any(x in lowered for x in _PLACEHOLDER_MARKERS):
             continue
 
-        for pattern in patterns:
-            if re.search(pattern, line, re.IGNORECASE):
+        # Only the first `token =` needs its tail searched: a literal after
+        # any later one also follows the first
+        token_seen = False
+        for match in _SENSITIVE_RE.finditer(line):
+            if match.lastgroup != "token":
                 return True
+            if not token_seen:
+                token_seen = True
+                if _TOKEN_VALUE_RE.search(line, match.end()):
+                    return True
     return False
 
 
+def report_sensitive_data() -> None:
+    """Check the staged diff for sensitive data and print the (non-blocking) result."""
+    print("Checking for sensitive data... ", end="", flush=True)
+    diff = get_staged_diff()
+    if check_sensitive_data(diff):
+        print(f"{YELLOW}⚠ potential sensitive data detected - please review{NC}")
+    else:
+        print(f"{GREEN}✔{NC}")
+
+
 def main() -> int:
     """Main pre-commit hook function."""
-    # Get git directory and check for rebase
-    git_dir = get_git_dir()
+    # Get repo root + git directory and check for rebase
+    repo_root, git_dir = get_git_paths()
 
     if is_rebase_in_progress(git_dir):
         print(f"{BLUE}[pre-commit] Skipping validation during rebase/cherry-pick/merge{NC}")
         return 0  # Allow commit to proceed without validation
 
-    repo_root = Path(subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True, text=True
-    ).stdout.strip())
-
     print("Running pre-commit validations...")
 
     validation_failed = False
     staged_files = get_staged_files()
 
+    if not staged_files:
+        print(f"{GREEN}Nothing staged, skipping validations{NC}")
+        return 0
+
+    # Docs-only commits skip every step except the sensitive-data check
+    if all(f.endswith(_DOC_SUFFIXES) or f.startswith(_DOC_DIR) for f in staged_files):
+        print(f"{BLUE}[pre-commit] Docs-only commit, only checking for sensitive data{NC}")
+        report_sensitive_data()
+        print(f"{GREEN}Pre-commit validations passed{NC}")
+        return 0
+
+    # Classify staged files in a single pass. Deleted files are dropped here
+    # (one stat each) so the validation steps below don't stat them again.
+    marketplace_changed = False
+    version_files_changed = False
+    plugin_jsons: list[str] = []
+    hooks_jsons: list[str] = []
+    py_files: list[str] = []
+    for f in staged_files:
+        if "marketplace.json" in f:
+            marketplace_changed = True
+        if f.endswith(_VERSION_FILES):
+            version_files_changed = True
+        elif "/" not in f and (repo_root / f).is_dir():
+            # Plugin submodule pointer bump: its version may have changed
+            version_files_changed = True
+        if f.endswith(".py"):
+            bucket = py_files
+        elif f.endswith("plugin.json"):
+            bucket = plugin_jsons
+        elif f.endswith("hooks.json"):
+            bucket = hooks_jsons
+        else:
+            continue
+        if (repo_root / f).exists():
+            bucket.append(f)
+
     # 1. Validate marketplace.json if changed
-    if any("marketplace.json" in f for f in staged_files):
+    if marketplace_changed:
         print("Validating marketplace.json... ", end="", flush=True)
         passed, msg = validate_marketplace_json(repo_root)
         if passed:
@@ -266,33 +412,38 @@ def main() -> int:
             print(f"{RED}Marketplace validation failed. {msg}{NC}")
             validation_failed = True
 
-    # 2. Validate changed plugin.json files
-    plugin_jsons = [f for f in staged_files if f.endswith("plugin.json")]
-    for plugin_json in plugin_jsons:
-        file_path = repo_root / plugin_json
-        if file_path.exists():
+    # 2-3. Validate changed plugin.json and hooks.json files. The files are
+    # independent and the hooks validator runs in a subprocess, so all of
+    # them run concurrently; results are reported in staging order.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        plugin_results = executor.map(
+            validate_plugin_json,
+            [repo_root / f for f in plugin_jsons],
+        )
+        hooks_future = executor.submit(
+            validate_hooks_jsons,
+            [repo_root / f for f in hooks_jsons],
+            repo_root,
+        )
+
+        # 2. Validate changed plugin.json files
+        for plugin_json, (passed, msg) in zip(plugin_jsons, plugin_results):
             print(f"Validating {plugin_json}... ", end="", flush=True)
-            passed, msg = validate_plugin_json(file_path)
             if passed:
                 print(f"{GREEN}✔{NC}")
             else:
                 print(f"{RED}✘ {msg}{NC}")
                 validation_failed = True
 
-    # 3. Validate changed hooks.json files
-    hooks_jsons = [f for f in staged_files if f.endswith("hooks.json")]
-    for hooks_json in hooks_jsons:
-        file_path = repo_root / hooks_json
-        if file_path.exists():
+        # 3. Validate changed hooks.json files
+        for hooks_json, (passed, msg) in zip(hooks_jsons, hooks_future.result()):
             print(f"Validating {hooks_json}... ", end="", flush=True)
-            passed, msg = validate_hooks_json(file_path, repo_root)
             if passed:
                 print(f"{GREEN}✔{NC}" + (f" ({msg})" if msg else ""))
             else:
                 print(f"{YELLOW}⚠ {msg}{NC}")
 
     # 4. Lint changed Python files
-    py_files = [f for f in staged_files if f.endswith(".py")]
     if py_files:
         print("Linting Python files... ", end="", flush=True)
         passed, msg = lint_python_files(py_files, repo_root)
@@ -301,24 +452,22 @@ def main() -> int:
         else:
             print(f"{YELLOW}⚠ {msg}{NC}")
 
-    # 5. Check version consistency
+    # 5. Check version consistency (only when a version source is staged)
     print("Checking version consistency... ", end="", flush=True)
-    passed, was_fixed = check_version_consistency(repo_root)
-    if passed and not was_fixed:
-        print(f"{GREEN}✔{NC}")
-    elif was_fixed:
-        print(f"{YELLOW}⚠ versions out of sync, syncing...{NC}")
-        print("  Staged updated marketplace.json")
+    if not version_files_changed:
+        print(f"{GREEN}✔{NC} (no version files staged)")
     else:
-        print(f"{YELLOW}⚠ sync script not found{NC}")
+        passed, was_fixed = check_version_consistency(repo_root)
+        if passed and not was_fixed:
+            print(f"{GREEN}✔{NC}")
+        elif was_fixed:
+            print(f"{YELLOW}⚠ versions out of sync, syncing...{NC}")
+            print("  Staged updated marketplace.json")
+        else:
+            print(f"{YELLOW}⚠ sync script not found{NC}")
 
     # 6. Check for sensitive data
-    print("Checking for sensitive data... ", end="", flush=True)
-    diff = get_staged_diff()
-    if check_sensitive_data(diff):
-        print(f"{YELLOW}⚠ potential sensitive data detected - please review{NC}")
-    else:
-        print(f"{GREEN}✔{NC}")
+    report_sensitive_data()
 
     # Final result
     if validation_failed:
@@ -4,6 +4,10 @@
 Installed as .git/hooks/pre-push in any plugin or marketplace repo.
 Uses CPV (claude-plugins-validation) from the plugin cache with --strict.
 Validates the LOCAL repo (the one being pushed), blocking if any issues found.
+Validation is skipped when the pushed commits change no files at all
+(e.g. a push that only deletes refs).
+A clean tree that already passed the same CPV version is not re-validated
+(cache in .git/cpv-validation-cache).
 
 To install:
     python3 scripts/setup-hooks.py
@@ -17,6 +21,7 @@ Exit codes:
 """
 
 import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -35,32 +40,49 @@ BLUE = "\033[0;34m" if _USE_COLOR else ""
 BOLD = "\033[1m" if _USE_COLOR else ""
 NC = "\033[0m" if _USE_COLOR else ""
 
+# Validator output lines worth echoing (severity lines and the report header)
+_REPORT_LINE_RE = re.compile(
+    r"^.*(?:CRITICAL|MAJOR|MINOR|NIT|PASSED|Plugin Validation|Marketplace Validation).*$",
+    re.MULTILINE,
+)
+
+# Passed validations are remembered in the git dir, one key per line
+_CACHE_FILE = "cpv-validation-cache"
+_CACHE_MAX_ENTRIES = 50
+
 
 def find_cpv_dir() -> Path | None:
-    """Find the CPV plugin directory from the installed plugin cache."""
-    cache_base = Path.home() / ".claude" / "plugins" / "cache" / "emasoft-plugins" / "claude-plugins-validation"
-    if not cache_base.is_dir():
-        return None
-    # Get latest version directory by sorting version strings
-    versions = sorted(
-        [d for d in cache_base.iterdir() if d.is_dir()],
-        key=lambda d: d.name,
+    """Find the CPV plugin directory from the installed plugin cache.
+
+    Works on plain string paths and only builds a Path for the result.
+    """
+    cache_base = os.path.join(
+        os.path.expanduser("~"), ".claude", "plugins", "cache", "emasoft-plugins", "claude-plugins-validation"
     )
+    # Get latest version directory by sorting version strings. scandir's
+    # entries carry the file type, so is_dir() needs no extra stat per entry;
+    # a missing cache surfaces as an error instead of a separate is_dir() probe
+    try:
+        with os.scandir(cache_base) as it:
+            versions = sorted(entry.name for entry in it if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
     if not versions:
         return None
-    latest = versions[-1]
-    if (latest / "scripts" / "validate_plugin.py").is_file():
-        return latest
+    latest = os.path.join(cache_base, versions[-1])
+    if os.path.isfile(os.path.join(latest, "scripts", "validate_plugin.py")):
+        return Path(latest)
     return None
 
 
-def get_repo_root() -> Path:
-    """Return the git repository root."""
+def get_git_paths() -> tuple[Path, Path]:
+    """Return the git repository root and git directory in one git call."""
     result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
+        ["git", "rev-parse", "--show-toplevel", "--absolute-git-dir"],
         capture_output=True, text=True, check=True,
     )
-    return Path(result.stdout.strip())
+    repo_root, git_dir = result.stdout.splitlines()
+    return Path(repo_root), Path(git_dir)
 
 
 def is_marketplace(repo_root: Path) -> bool:
@@ -73,6 +95,77 @@ def is_plugin(repo_root: Path) -> bool:
     return (repo_root / ".claude-plugin" / "plugin.json").is_file()
 
 
+def get_pushed_files(repo_root: Path, push_info: str) -> set[str] | None:
+    """Return the files changed by the refs being pushed.
+
+    `push_info` is the hook's stdin: one `<local ref> <local sha> <remote ref>
+    <remote sha>` line per ref. Deleted refs contribute nothing. Returns None
+    when the answer is unknown (new branch, remote commit not available
+    locally, no refs given), meaning everything should be validated.
+    """
+    files: set[str] = set()
+    seen_ref = False
+    for line in push_info.splitlines():
+        fields = line.split()
+        if len(fields) != 4:
+            continue
+        seen_ref = True
+        _, local_sha, _, remote_sha = fields
+        if not local_sha.strip("0"):
+            continue  # Ref deletion: nothing to validate
+        if not remote_sha.strip("0"):
+            return None  # New branch: no base to diff against
+        result = subprocess.run(
+            ["git", "diff", "--name-only", f"{remote_sha}..{local_sha}"],
+            capture_output=True, text=True, cwd=repo_root,
+        )
+        if result.returncode != 0:
+            return None
+        files.update(result.stdout.splitlines())
+    if not seen_ref:
+        return None
+    return files
+
+
+def get_validation_cache_key(repo_root: Path, cpv_dir: Path, script_name: str) -> str | None:
+    """Identify a validation run by validator, CPV version and HEAD's tree.
+
+    Returns None when the working tree has uncommitted or untracked changes,
+    since the validator sees those files but the tree hash doesn't.
+    """
+    status = subprocess.run(
+        ["git", "status", "--porcelain"],
+        capture_output=True, text=True, cwd=repo_root,
+    )
+    if status.returncode != 0 or status.stdout:
+        return None
+    tree = subprocess.run(
+        ["git", "rev-parse", "HEAD^{tree}"],
+        capture_output=True, text=True, cwd=repo_root,
+    )
+    if tree.returncode != 0:
+        return None
+    return f"{script_name} {cpv_dir.name} {tree.stdout.strip()}"
+
+
+def load_validation_cache(git_dir: Path) -> list[str]:
+    """Return the keys of previously passed validations."""
+    try:
+        return (git_dir / _CACHE_FILE).read_text().splitlines()
+    except OSError:
+        return []
+
+
+def save_validation_cache(git_dir: Path, key: str) -> None:
+    """Record a passed validation, keeping only the most recent entries."""
+    entries = load_validation_cache(git_dir)
+    entries.append(key)
+    try:
+        (git_dir / _CACHE_FILE).write_text("\n".join(entries[-_CACHE_MAX_ENTRIES:]) + "\n")
+    except OSError:
+        pass  # Caching is best-effort
+
+
 def run_validator(
     cpv_dir: Path,
     script_name: str,
@@ -101,7 +194,10 @@ def run_validator(
 
 
 def main() -> int:
-    repo_root = get_repo_root()
+    repo_root, git_dir = get_git_paths()
+    # git passes the refs being pushed on stdin; a manual run has none
+    push_info = "" if sys.stdin.isatty() else sys.stdin.read()
+    pushed_files = get_pushed_files(repo_root, push_info)
 
     print(f"{BOLD}{'=' * 60}{NC}")
     print(f"{BOLD}Pre-Push Validation (--strict){NC}")
@@ -122,25 +218,44 @@ def main() -> int:
     # Detect what kind of repo this is and validate accordingly
     if is_marketplace(repo_root):
         print(f"{BLUE}Detected: marketplace repo{NC}")
+        # The validator also reads the README and plugin directories, so only
+        # skip when the push carries no changes at all
+        if pushed_files is not None and not pushed_files:
+            print(f"{GREEN}No changes in this push. Skipping validation.{NC}")
+            return 0
         print(f"{BLUE}Validating marketplace.json with --strict...{NC}")
-        code, output = run_validator(cpv_dir, "validate_marketplace.py", repo_root)
+        script_name = "validate_marketplace.py"
     elif is_plugin(repo_root):
         print(f"{BLUE}Detected: plugin repo{NC}")
+        # Any file can affect a plugin's verdict, so only skip when the push
+        # carries no changes at all (e.g. only deletes refs)
+        if pushed_files is not None and not pushed_files:
+            print(f"{GREEN}No changes in this push. Skipping validation.{NC}")
+            return 0
         print(f"{BLUE}Validating plugin with --strict...{NC}")
-        code, output = run_validator(cpv_dir, "validate_plugin.py", repo_root)
+        script_name = "validate_plugin.py"
     else:
         print(f"{YELLOW}Not a plugin or marketplace repo. Skipping validation.{NC}")
         return 0
 
+    # A clean tree that already passed this validator version needs no re-run
+    cache_key = get_validation_cache_key(repo_root, cpv_dir, script_name)
+    if cache_key is not None and cache_key in load_validation_cache(git_dir):
+        print(f"{GREEN}This tree already passed {script_name} (cached). Skipping validation.{NC}")
+        return 0
+
+    code, output = run_validator(cpv_dir, script_name, repo_root)
+
     # Show relevant output lines
-    for line in output.splitlines():
-        if any(sev in line for sev in ("CRITICAL", "MAJOR", "MINOR", "NIT", "PASSED", "Plugin Validation", "Marketplace Validation")):
-            print(f"  {line.strip()}")
+    for match in _REPORT_LINE_RE.finditer(output):
+        print(f"  {match.group(0).strip()}")
 
     # Verdict
     print()
     print(f"{BOLD}{'=' * 60}{NC}")
     if code == 0:
+        if cache_key is not None:
+            save_validation_cache(git_dir, cache_key)
         print(f"{GREEN}  PASSED — push allowed{NC}")
         print(f"{BOLD}{'=' * 60}{NC}")
         return 0
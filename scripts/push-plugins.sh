@@ -1,13 +1,16 @@
 #!/usr/bin/env bash
 # Validate and push local plugin repos, then push marketplace.
-# Usage: ./scripts/push-plugins.sh [/path/to/plugin ...] [--dry-run] [--no-validate]
+# Usage: ./scripts/push-plugins.sh [/path/to/plugin ...] [--dry-run] [--no-validate] [--no-cache]
 #
 # Each path must be a local git clone of a plugin repo.
 # The script:
-#   1. Validates each local plugin with CPV validate_plugin.py --strict
-#   2. Pushes each plugin to its own git origin
+#   1. Validates each local plugin with CPV validate_plugin.py --strict (in parallel;
+#      plugins whose committed tree already passed are skipped unless --no-cache)
+#   2. Pushes each plugin to its own git origin (in parallel, without prompts;
+#      failed pushes are retried one at a time in the foreground)
 #   3. Syncs marketplace.json versions
-#   4. Validates marketplace with CPV validate_marketplace.py --strict
+#   4. Validates marketplace with CPV validate_marketplace.py --strict (skipped
+#      when its committed tree already passed with the same CPV, unless --no-cache)
 #   5. Pushes the marketplace repo
 #
 # If no plugin paths given, only the marketplace is validated and pushed.
@@ -39,10 +42,63 @@ find_cpv_dir() {
     fi
 }
 
+# Key for the validation cache shared with pre-push-hook.py: validator, CPV
+# version and HEAD's tree. Prints nothing when the repo has uncommitted or
+# untracked changes, since the validator sees those but the tree hash doesn't.
+validation_cache_key() {
+    local repo="$1" script="$2" status tree
+    status=$(git -C "$repo" status --porcelain 2>/dev/null) || return 0
+    [ -z "$status" ] || return 0
+    tree=$(git -C "$repo" rev-parse 'HEAD^{tree}' 2>/dev/null) || return 0
+    echo "$script $(basename "$CPV_DIR") $tree"
+}
+
+# Append a key to a validation cache file, keeping the same 50-entry limit
+# as pre-push-hook.py
+record_validation() {
+    local cache="$1" key="$2"
+    { cat "$cache" 2>/dev/null; echo "$key"; } | tail -n 50 > "$cache.tmp" && mv "$cache.tmp" "$cache"
+}
+
+# Validate one plugin with CPV --strict. Meant to run as a background job:
+# writes the validator output to "$2.out" and its exit code to "$2.code"
+# ("$2.cached" marks a cache hit). A clean tree that already passed the same
+# CPV version (here or in the pre-push hook) is not re-validated.
+validate_plugin() {
+    local plugin_path="$1" result="$2" key cache code
+    key=$(validation_cache_key "$plugin_path" validate_plugin.py)
+    cache="$(git -C "$plugin_path" rev-parse --absolute-git-dir)/cpv-validation-cache"
+    if [ -n "$key" ] && [ -n "$USE_CACHE" ] && grep -qxF "$key" "$cache" 2>/dev/null; then
+        : > "$result.out"
+        touch "$result.cached"
+        echo 0 > "$result.code"
+        return
+    fi
+    (cd "$CPV_DIR" && uv run python "$VALIDATOR" "$plugin_path" --strict) > "$result.out" 2>&1
+    code=$?
+    if [ "$code" -eq 0 ] && [ -n "$key" ]; then
+        record_validation "$cache" "$key"
+    fi
+    echo "$code" > "$result.code"
+}
+
+# Push one plugin's branch to origin. Meant to run as a background job:
+# writes git's output to "$3.push.out" and its exit code to "$3.push.code".
+# Parallel jobs must not prompt (they would fight over the terminal), so
+# credential and passphrase prompts are disabled; a push that needed one
+# fails here and is retried in the foreground.
+push_plugin() {
+    local plugin_path="$1" branch="$2" result="$3"
+    (cd "$plugin_path" && GIT_TERMINAL_PROMPT=0 GIT_SSH_COMMAND="${GIT_SSH_COMMAND:-ssh} -oBatchMode=yes" \
+        git push origin "$branch") < /dev/null > "$result.push.out" 2>&1
+    echo $? > "$result.push.code"
+}
+
 # ── Parse arguments ──────────────────────────────────────────────────
 
 DRY_RUN=""
 VALIDATE="yes"
+USE_CACHE="yes"
 declare -a PLUGIN_PATHS=()
 
 for arg in "$@"; do
@@ -50,6 +106,8 @@ for arg in "$@"; do
         DRY_RUN="yes"
     elif [ "$arg" = "--no-validate" ]; then
         VALIDATE=""
+    elif [ "$arg" = "--no-cache" ]; then
+        USE_CACHE=""
     else
         # Resolve to absolute path
         resolved="$(cd "$arg" 2>/dev/null && pwd)" || {
@@ -66,6 +124,8 @@ declare -a PUSHED=()
 declare -a VALIDATION_FAILED_LIST=()
 declare -a PUSH_FAILED_LIST=()
 declare -a SKIPPED=()
+declare -a PUSHING=()
+declare -a BRANCHES=()
 
 PLUGIN_COUNT=${#PLUGIN_PATHS[@]}
 echo "============================================================"
@@ -102,7 +162,23 @@ if [ "$PLUGIN_COUNT" -gt 0 ]; then
 
     set +e
 
-    for plugin_path in "${PLUGIN_PATHS[@]}"; do
+    # Plugins are independent, so start every validation at once and wait:
+    # wall time becomes the slowest plugin instead of the sum of all of them.
+    # Results are read back below in argument order.
+    RESULTS_DIR=$(mktemp -d)
+    trap 'rm -rf "$RESULTS_DIR"' EXIT
+    if [ -n "$VALIDATE" ]; then
+        for i in "${!PLUGIN_PATHS[@]}"; do
+            plugin_path="${PLUGIN_PATHS[$i]}"
+            if [ -d "$plugin_path/.git" ] && [ -f "$plugin_path/.claude-plugin/plugin.json" ]; then
+                validate_plugin "$plugin_path" "$RESULTS_DIR/$i" &
+            fi
+        done
+        wait
+    fi
+
+    for i in "${!PLUGIN_PATHS[@]}"; do
+        plugin_path="${PLUGIN_PATHS[$i]}"
         plugin_name=$(basename "$plugin_path")
         echo -n "  $plugin_name ($plugin_path)... "
 
@@ -124,9 +200,12 @@ if [ "$PLUGIN_COUNT" -gt 0 ]; then
 
         # Validate with CPV --strict
         if [ -n "$VALIDATE" ]; then
-            VOUTPUT=$(cd "$CPV_DIR" && uv run python "$VALIDATOR" "$plugin_path" --strict 2>&1)
-            VCODE=$?
-            if [ "$VCODE" -eq 0 ]; then
+            VOUTPUT=$(cat "$RESULTS_DIR/$i.out")
+            VCODE=$(cat "$RESULTS_DIR/$i.code")
+            if [ "$VCODE" -eq 0 ] && [ -f "$RESULTS_DIR/$i.cached" ]; then
+                echo -n "PASSED (cached) "
+                VALIDATED+=("$plugin_name")
+            elif [ "$VCODE" -eq 0 ]; then
                 echo -n "PASSED "
                 VALIDATED+=("$plugin_name")
             else
@@ -144,15 +223,37 @@ if [ "$PLUGIN_COUNT" -gt 0 ]; then
             echo "DRY-RUN (would push to origin/$BRANCH)"
             SKIPPED+=("$plugin_name (dry-run)")
         else
-            if (cd "$plugin_path" && git push origin "$BRANCH" 2>&1); then
-                echo "PUSHED"
+            echo "PUSHING to origin/$BRANCH"
+            push_plugin "$plugin_path" "$BRANCH" "$RESULTS_DIR/$i" &
+            PUSHING+=("$i")
+            BRANCHES[$i]="$BRANCH"
+        fi
+    done
+
+    # Pushes are independent network round trips, so they all run at once;
+    # report them in argument order once every push has finished. Failed
+    # pushes are retried one at a time in the foreground, where git can
+    # prompt for credentials or a key passphrase.
+    if [ ${#PUSHING[@]} -gt 0 ]; then
+        wait
+        for i in "${PUSHING[@]}"; do
+            plugin_name=$(basename "${PLUGIN_PATHS[$i]}")
+            cat "$RESULTS_DIR/$i.push.out"
+            if [ "$(cat "$RESULTS_DIR/$i.push.code")" -eq 0 ]; then
+                echo "  $plugin_name... PUSHED"
+                PUSHED+=("$plugin_name")
+                continue
+            fi
+            echo "  $plugin_name... push failed, retrying in the foreground"
+            if (cd "${PLUGIN_PATHS[$i]}" && git push origin "${BRANCHES[$i]}"); then
+                echo "  $plugin_name... PUSHED"
                 PUSHED+=("$plugin_name")
             else
-                echo "PUSH FAILED"
+                echo "  $plugin_name... PUSH FAILED"
                 PUSH_FAILED_LIST+=("$plugin_name")
             fi
-        fi
-    done
+        done
+    fi
 
     set -e
 
@@ -172,12 +273,26 @@ echo "--- marketplace validation (--strict) ---"
 
 if [ -n "$VALIDATE" ] && [ -f "$MARKETPLACE_VALIDATOR" ]; then
     echo -n "  marketplace.json... "
-    set +e
-    VOUTPUT=$(cd "$CPV_DIR" && uv run python "$MARKETPLACE_VALIDATOR" "$MARKETPLACE_DIR" --strict 2>&1)
-    VCODE=$?
-    set -e
+    # The validator also reads the README and plugin directories, so the
+    # whole clean tree keys the result (same key as pre-push-hook.py)
+    VNOTE=""
+    MARKETPLACE_KEY=$(validation_cache_key "$MARKETPLACE_DIR" validate_marketplace.py)
+    MARKETPLACE_CACHE="$(git -C "$MARKETPLACE_DIR" rev-parse --absolute-git-dir)/cpv-validation-cache"
+    if [ -n "$MARKETPLACE_KEY" ] && [ -n "$USE_CACHE" ] && grep -qxF "$MARKETPLACE_KEY" "$MARKETPLACE_CACHE" 2>/dev/null; then
+        VOUTPUT=""
+        VCODE=0
+        VNOTE=" (cached)"
+    else
+        set +e
+        VOUTPUT=$(cd "$CPV_DIR" && uv run python "$MARKETPLACE_VALIDATOR" "$MARKETPLACE_DIR" --strict 2>&1)
+        VCODE=$?
+        set -e
+        if [ "$VCODE" -eq 0 ] && [ -n "$MARKETPLACE_KEY" ]; then
+            record_validation "$MARKETPLACE_CACHE" "$MARKETPLACE_KEY"
+        fi
+    fi
     if [ "$VCODE" -eq 0 ]; then
-        echo "PASSED"
+        echo "PASSED$VNOTE"
     else
         echo "BLOCKED (exit $VCODE)"
         echo "$VOUTPUT" | grep -E "CRITICAL|MAJOR|MINOR|NIT" | head -10
@@ -212,11 +327,22 @@ fi
 echo ""
 echo "--- marketplace push ---"
 
-BRANCH=$(git symbolic-ref --short HEAD 2>/dev/null || echo "main")
-LOCAL=$(git rev-parse HEAD 2>/dev/null)
+# One `git status` reports the branch, HEAD and any staged changes, instead of
+# separate symbolic-ref / rev-parse HEAD / diff --staged calls
+BRANCH="main"
+LOCAL=""
+STAGED=""
+while IFS= read -r line; do
+    case "$line" in
+        "# branch.oid "*) LOCAL="${line#"# branch.oid "}" ;;
+        "# branch.head (detached)") ;;
+        "# branch.head "*) BRANCH="${line#"# branch.head "}" ;;
+        "1 "[!.]*|"2 "[!.]*|"u "*) STAGED="yes" ;;
+    esac
+done < <(git status --porcelain=v2 --branch --untracked-files=no 2>/dev/null)
 REMOTE=$(git rev-parse "origin/$BRANCH" 2>/dev/null || echo "none")
 
-if [ "$LOCAL" = "$REMOTE" ] && git diff --staged --quiet 2>/dev/null; then
+if [ "$LOCAL" = "$REMOTE" ] && [ -z "$STAGED" ]; then
     echo "  SKIP: marketplace already up to date"
     SKIPPED+=("marketplace (up to date)")
 else
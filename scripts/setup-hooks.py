@@ -22,11 +22,14 @@ Usage:
     python scripts/setup-hooks.py
 """
 
+import functools
+import io
 import os
 import shutil
-import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TextIO
 
 # ANSI Colors
 GREEN = "\033[0;32m"
@@ -35,111 +38,64 @@ RED = "\033[0;31m"
 BLUE = "\033[0;34m"
 NC = "\033[0m"
 
+# Generated hook sources. Nothing is interpolated, so they are plain bytes
+# written as-is for the main repo and every submodule.
+#
+# Each hook is a sh shim that exits before starting Python when git-cliff
+# or cliff.toml is missing (git runs hooks from the work tree root), then
+# feeds the Python body to python3 on stdin. The bodies only use the stdlib,
+# so -S skips the site-packages setup, which costs more than compiling them.
+_HOOK_SHIM = b'''#!/bin/sh
+command -v git-cliff >/dev/null 2>&1 && [ -f cliff.toml ] || exit 0
+exec python3 -S - "$@" <<'PYTHON'
+'''
 
-def check_git_cliff() -> bool:
-    """Check if git-cliff is installed."""
-    return shutil.which("git-cliff") is not None
-
-
-def make_executable(path: Path) -> None:
-    """Make a file executable."""
-    current = os.stat(path)
-    os.chmod(path, current.st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
-
-
-def create_pre_commit_hook(hooks_dir: Path, repo_root: Path) -> None:
-    """Create pre-commit hook for main repo with rebase detection."""
-    source = repo_root / "scripts" / "pre-commit-hook.py"
-    target = hooks_dir / "pre-commit"
-
-    if source.exists():
-        shutil.copy2(source, target)
-        make_executable(target)
-        print(f"{GREEN}✓{NC} Created pre-commit hook")
-    else:
-        print(f"{YELLOW}⚠{NC} pre-commit-hook.py not found, skipping")
-
-
-def create_pre_push_hook(hooks_dir: Path, repo_root: Path) -> None:
-    """Create pre-push hook for main repo."""
-    source = repo_root / "scripts" / "pre-push-hook.py"
-    target = hooks_dir / "pre-push"
-
-    if source.exists():
-        shutil.copy2(source, target)
-        make_executable(target)
-        print(f"{GREEN}✓{NC} Created pre-push hook")
-    else:
-        print(f"{YELLOW}⚠{NC} pre-push-hook.py not found, skipping")
-
-
-def create_post_rewrite_hook(hooks_dir: Path, repo_name: str = "main repo") -> None:
-    """Create post-rewrite hook for changelog generation after rebase/amend.
-
-    post-rewrite fires ONCE after:
-    - git rebase completes (all commits replayed)
-    - git commit --amend completes
-
-    This avoids the mid-rebase CHANGELOG conflicts.
-    """
-    hook_content = f'''#!/usr/bin/env python3
-"""post-rewrite hook: Update CHANGELOG.md after rebase/amend completes.
+_POST_REWRITE_HOOK = _HOOK_SHIM + b'''"""post-rewrite hook: Update CHANGELOG.md after rebase/amend completes.
 
 This hook fires ONCE after rebase or amend operations complete,
 avoiding the mid-rebase conflicts that post-commit causes.
 
 Arguments passed by git:
 - $1: "rebase" or "amend"
-- stdin: list of rewritten commits (old-sha new-sha)
+- stdin: list of rewritten commits (old-sha new-sha), not read here
 """
 
-import shutil
 import subprocess
 import sys
-from pathlib import Path
 
 
-def main() -> int:
-    operation = sys.argv[1] if len(sys.argv) > 1 else "unknown"
+def read_changelog() -> bytes | None:
+    try:
+        with open("CHANGELOG.md", "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
-    if not shutil.which("git-cliff"):
-        return 0  # Silent skip if git-cliff not installed
 
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    repo_root = Path(result.stdout.strip())
+def main() -> int:
+    operation = sys.argv[1] if len(sys.argv) > 1 else "unknown"
 
-    cliff_toml = repo_root / "cliff.toml"
-    if not cliff_toml.exists():
-        return 0  # Silent skip if no cliff.toml
+    # git runs hooks from the top of the working tree, so relative paths
+    # (and git-cliff's cwd) already point at the repo root
+    print(f"[post-rewrite] Regenerating CHANGELOG.md after {operation}...")
 
-    print(f"[post-rewrite] Regenerating CHANGELOG.md after {{operation}}...")
+    # Snapshot the changelog so the change check is a byte comparison
+    # instead of a `git diff` subprocess
+    before = read_changelog()
 
     result = subprocess.run(
         ["git-cliff", "-o", "CHANGELOG.md"],
-        cwd=repo_root,
         capture_output=True,
         text=True,
         timeout=60,
     )
 
     if result.returncode != 0:
-        print(f"Warning: git-cliff failed: {{result.stderr}}")
+        print(f"Warning: git-cliff failed: {result.stderr}")
         return 0
 
     # Check if changelog changed
-    status = subprocess.run(
-        ["git", "diff", "--quiet", "CHANGELOG.md"],
-        cwd=repo_root,
-        capture_output=True,
-        timeout=30,
-    )
-
-    if status.returncode != 0:
+    if read_changelog() != before:
         print("CHANGELOG.md updated - remember to commit it!")
 
     return 0
@@ -147,63 +103,40 @@ def main() -> int:
 
 if __name__ == "__main__":
     sys.exit(main())
+PYTHON
 '''
 
-    target = hooks_dir / "post-rewrite"
-    target.write_text(hook_content)
-    make_executable(target)
-    print(f"{GREEN}✓{NC} Created post-rewrite hook ({repo_name})")
+_POST_MERGE_HOOK = _HOOK_SHIM + b'''"""post-merge hook: Update CHANGELOG.md after merge completes."""
 
-
-def create_post_merge_hook(hooks_dir: Path, repo_name: str = "main repo") -> None:
-    """Create post-merge hook for changelog generation after merge."""
-    hook_content = f'''#!/usr/bin/env python3
-"""post-merge hook: Update CHANGELOG.md after merge completes."""
-
-import shutil
 import subprocess
 import sys
-from pathlib import Path
-
 
-def main() -> int:
-    if not shutil.which("git-cliff"):
-        return 0
 
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    repo_root = Path(result.stdout.strip())
+def read_changelog() -> bytes | None:
+    try:
+        with open("CHANGELOG.md", "rb") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
 
-    cliff_toml = repo_root / "cliff.toml"
-    if not cliff_toml.exists():
-        return 0
 
+def main() -> int:
     print("[post-merge] Regenerating CHANGELOG.md...")
 
+    before = read_changelog()
+
     result = subprocess.run(
         ["git-cliff", "-o", "CHANGELOG.md"],
-        cwd=repo_root,
         capture_output=True,
         text=True,
         timeout=60,
     )
 
     if result.returncode != 0:
-        print(f"Warning: git-cliff failed: {{result.stderr}}")
+        print(f"Warning: git-cliff failed: {result.stderr}")
         return 0
 
-    status = subprocess.run(
-        ["git", "diff", "--quiet", "CHANGELOG.md"],
-        cwd=repo_root,
-        capture_output=True,
-        timeout=30,
-    )
-
-    if status.returncode != 0:
+    if read_changelog() != before:
         print("CHANGELOG.md updated - remember to commit it!")
 
     return 0
@@ -211,40 +144,109 @@ def main() -> int:
 
 if __name__ == "__main__":
     sys.exit(main())
+PYTHON
 '''
 
+
+def check_git_cliff() -> bool:
+    """Check if git-cliff is installed."""
+    return shutil.which("git-cliff") is not None
+
+
+def make_executable(path: Path) -> None:
+    """Make a file executable.
+
+    Hooks are always installed as rwxr-xr-x, so set the mode directly
+    instead of reading it back first.
+    """
+    os.chmod(path, 0o755)
+
+
+def create_pre_commit_hook(hooks_dir: Path, repo_root: Path) -> None:
+    """Create pre-commit hook for main repo with rebase detection."""
+    source = repo_root / "scripts" / "pre-commit-hook.py"
+    target = hooks_dir / "pre-commit"
+
+    if source.exists():
+        shutil.copyfile(source, target)
+        make_executable(target)
+        print(f"{GREEN}✓{NC} Created pre-commit hook")
+    else:
+        print(f"{YELLOW}⚠{NC} pre-commit-hook.py not found, skipping")
+
+
+def create_pre_push_hook(hooks_dir: Path, repo_root: Path) -> None:
+    """Create pre-push hook for main repo."""
+    source = repo_root / "scripts" / "pre-push-hook.py"
+    target = hooks_dir / "pre-push"
+
+    if source.exists():
+        shutil.copyfile(source, target)
+        make_executable(target)
+        print(f"{GREEN}✓{NC} Created pre-push hook")
+    else:
+        print(f"{YELLOW}⚠{NC} pre-push-hook.py not found, skipping")
+
+
+def create_post_rewrite_hook(hooks_dir: Path, repo_name: str = "main repo", out: TextIO | None = None) -> None:
+    """Create post-rewrite hook for changelog generation after rebase/amend.
+
+    post-rewrite fires ONCE after:
+    - git rebase completes (all commits replayed)
+    - git commit --amend completes
+
+    This avoids the mid-rebase CHANGELOG conflicts.
+    """
+    target = hooks_dir / "post-rewrite"
+    target.write_bytes(_POST_REWRITE_HOOK)
+    make_executable(target)
+    print(f"{GREEN}✓{NC} Created post-rewrite hook ({repo_name})", file=out)
+
+
+def create_post_merge_hook(hooks_dir: Path, repo_name: str = "main repo", out: TextIO | None = None) -> None:
+    """Create post-merge hook for changelog generation after merge."""
     target = hooks_dir / "post-merge"
-    target.write_text(hook_content)
+    target.write_bytes(_POST_MERGE_HOOK)
     make_executable(target)
-    print(f"{GREEN}✓{NC} Created post-merge hook ({repo_name})")
+    print(f"{GREEN}✓{NC} Created post-merge hook ({repo_name})", file=out)
 
 
-def remove_old_post_commit_hook(hooks_dir: Path, repo_name: str = "main repo") -> None:
+def remove_old_post_commit_hook(hooks_dir: Path, repo_name: str = "main repo", out: TextIO | None = None) -> None:
     """Remove the old post-commit hook that caused rebase conflicts."""
     post_commit = hooks_dir / "post-commit"
     if post_commit.exists():
         post_commit.unlink()
-        print(f"{YELLOW}→{NC} Removed old post-commit hook ({repo_name})")
+        print(f"{YELLOW}→{NC} Removed old post-commit hook ({repo_name})", file=out)
+
 
+def setup_submodule_hooks(submodule_name: str, repo_root: Path, out: TextIO | None = None) -> bool:
+    """Set up hooks for a submodule.
 
-def setup_submodule_hooks(submodule_name: str, repo_root: Path) -> bool:
-    """Set up hooks for a submodule."""
+    Progress messages go to `out` (stdout by default), so parallel runs can
+    buffer them and print each submodule's lines together.
+    """
     hooks_dir = repo_root / ".git" / "modules" / submodule_name / "hooks"
 
     if not hooks_dir.exists():
-        print(f"{RED}✗{NC} Submodule {submodule_name} not found or not initialized")
+        print(f"{RED}✗{NC} Submodule {submodule_name} not found or not initialized", file=out)
         return False
 
     # Remove old problematic post-commit hook
-    remove_old_post_commit_hook(hooks_dir, submodule_name)
+    remove_old_post_commit_hook(hooks_dir, submodule_name, out)
 
     # Install new hooks
-    create_post_rewrite_hook(hooks_dir, submodule_name)
-    create_post_merge_hook(hooks_dir, submodule_name)
+    create_post_rewrite_hook(hooks_dir, submodule_name, out)
+    create_post_merge_hook(hooks_dir, submodule_name, out)
 
     return True
 
 
+def setup_submodule_hooks_buffered(submodule_name: str, repo_root: Path) -> tuple[bool, str]:
+    """Run setup_submodule_hooks for one submodule, capturing its output."""
+    buf = io.StringIO()
+    return setup_submodule_hooks(submodule_name, repo_root, out=buf), buf.getvalue()
+
+
 def main() -> int:
     """Main setup function."""
     script_dir = Path(__file__).parent
@@ -282,8 +284,16 @@ def main() -> int:
     print(f"{BLUE}Submodule hooks{NC}")
     print("-" * 40)
 
-    setup_submodule_hooks("perfect-skill-suggester", repo_root)
-    setup_submodule_hooks("claude-plugins-validation", repo_root)
+    # Each submodule's hooks dir is independent, so install them all at once.
+    # Output is buffered per submodule and printed in list order.
+    submodules = [
+        "perfect-skill-suggester",
+        "claude-plugins-validation",
+    ]
+    with ThreadPoolExecutor(max_workers=min(8, len(submodules))) as executor:
+        setup = functools.partial(setup_submodule_hooks_buffered, repo_root=repo_root)
+        for _, output in executor.map(setup, submodules):
+            print(output, end="")
 
     # Summary
     print()
@@ -21,80 +21,10 @@ Options:
 from __future__ import annotations
 
 import argparse
-import json
-import re
 import sys
 from pathlib import Path
 
-
-def get_plugin_version(plugin_dir: Path) -> str | None:
-    """Get the version from a plugin directory.
-
-    Checks multiple sources in order of priority:
-    1. .claude-plugin/plugin.json (standard Claude Code plugin)
-    2. pyproject.toml (Python projects)
-    3. package.json (Node.js projects)
-    """
-    # Try .claude-plugin/plugin.json first
-    plugin_json = plugin_dir / ".claude-plugin" / "plugin.json"
-    if plugin_json.exists():
-        try:
-            with open(plugin_json, encoding="utf-8") as f:
-                data = json.load(f)
-                version = data.get("version")
-                if version:
-                    return version
-        except (OSError, json.JSONDecodeError):
-            pass
-
-    # Try pyproject.toml (Python projects)
-    pyproject = plugin_dir / "pyproject.toml"
-    if pyproject.exists():
-        try:
-            with open(pyproject, encoding="utf-8") as f:
-                content = f.read()
-                # Simple regex to extract version from [project] section
-                match = re.search(r'^\s*version\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
-                if match:
-                    return match.group(1)
-        except OSError:
-            pass
-
-    # Try package.json (Node.js projects)
-    package_json = plugin_dir / "package.json"
-    if package_json.exists():
-        try:
-            with open(package_json, encoding="utf-8") as f:
-                data = json.load(f)
-                version = data.get("version")
-                if version:
-                    return version
-        except (OSError, json.JSONDecodeError):
-            pass
-
-    return None
-
-
-def load_marketplace(marketplace_path: Path) -> dict | None:
-    """Load marketplace.json."""
-    try:
-        with open(marketplace_path, encoding="utf-8") as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
-        print(f"Error loading marketplace.json: {e}", file=sys.stderr)
-        return None
-
-
-def save_marketplace(marketplace_path: Path, data: dict) -> bool:
-    """Save marketplace.json with proper formatting."""
-    try:
-        with open(marketplace_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")
-        return True
-    except OSError as e:
-        print(f"Error saving marketplace.json: {e}", file=sys.stderr)
-        return False
+from _sync_lib import load_marketplace_json, locate_plugins, read_plugin_versions, save_json
 
 
 def sync_versions(
@@ -113,17 +43,13 @@ def sync_versions(
     Returns:
         Tuple of (exit_code, list of (plugin_name, old_version, new_version))
     """
-    # Find marketplace.json
-    marketplace_path = repo_root / ".claude-plugin" / "marketplace.json"
-    if not marketplace_path.exists():
-        marketplace_path = repo_root / "marketplace.json"
-
-    if not marketplace_path.exists():
+    # Find and load marketplace.json
+    found = load_marketplace_json(repo_root)
+    if found is None:
         print("Error: marketplace.json not found", file=sys.stderr)
         return 1, []
 
-    # Load marketplace data
-    marketplace = load_marketplace(marketplace_path)
+    marketplace_path, marketplace = found
     if marketplace is None:
         return 1, []
 
@@ -133,24 +59,27 @@ def sync_versions(
             print("No plugins found in marketplace.json")
         return 0, []
 
+    # Plugins are submodules next to marketplace.json, whatever their source
+    targets = locate_plugins(repo_root, plugins, use_sources=False)
+    versions = read_plugin_versions(
+        repo_root, [plugin_dir for _, plugin_dir, found in targets if found], "sync-versions-cache"
+    )
+
     # Track changes
     changes: list[tuple[str, str, str]] = []
     has_mismatch = False
 
-    for plugin in plugins:
-        plugin_name = plugin.get("name")
-        if not plugin_name:
-            continue
+    for plugin, plugin_dir, found in targets:
+        plugin_name = plugin["name"]
 
         # Check if plugin directory exists (it's a submodule)
-        plugin_dir = repo_root / plugin_name
-        if not plugin_dir.exists():
+        if not found:
             if verbose:
                 print(f"  {plugin_name}: directory not found (remote-only plugin)")
             continue
 
         # Get version from plugin's manifest (plugin.json, pyproject.toml, or package.json)
-        plugin_version = get_plugin_version(plugin_dir)
+        plugin_version = versions[plugin_dir]
         if plugin_version is None:
             if verbose:
                 print(f"  {plugin_name}: no version found (checked plugin.json, pyproject.toml, package.json)")
@@ -175,7 +104,7 @@ def sync_versions(
 
     # Save changes if not in check mode
     if changes and not check_only:
-        if save_marketplace(marketplace_path, marketplace):
+        if save_json(marketplace_path, marketplace):
             print(f"Updated {len(changes)} plugin version(s) in marketplace.json")
         else:
             return 1, changes
@@ -2,9 +2,10 @@
 """
 sync_marketplace_versions.py - Sync plugin versions from plugin sources to marketplace.json
 
-This script reads version information from each plugin's plugin.json and updates
-the corresponding entry in marketplace.json. It supports both URL-based sources
-(dict with "source": "github") and path-based sources (string starting with "./").
+This script reads version information from each plugin's plugin.json (or
+pyproject.toml/package.json) and updates the corresponding entry in
+marketplace.json. It supports both URL-based sources (dict with "source":
+"github") and path-based sources (string starting with "./").
 
 Usage:
     python sync_marketplace_versions.py [--marketplace PATH] [--dry-run]
@@ -15,61 +16,18 @@ Exit codes:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 from typing import Any
 
-
-def find_marketplace_json(start_path: Path) -> Path | None:
-    """Find marketplace.json in common locations."""
-    candidates = [
-        start_path / ".claude-plugin" / "marketplace.json",
-        start_path / "marketplace.json",
-    ]
-    for candidate in candidates:
-        if candidate.exists():
-            return candidate
-    return None
-
-
-def load_json(path: Path) -> dict[str, Any] | None:
-    """Load and parse a JSON file."""
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError) as e:
-        print(f"Error loading {path}: {e}", file=sys.stderr)
-        return None
-
-
-def save_json(path: Path, data: dict[str, Any]) -> bool:
-    """Save data to a JSON file with pretty formatting."""
-    try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")
-        return True
-    except Exception as e:
-        print(f"Error saving {path}: {e}", file=sys.stderr)
-        return False
-
-
-def get_plugin_version(plugin_dir: Path) -> str | None:
-    """Get version from a plugin's plugin.json."""
-    plugin_json_path = plugin_dir / ".claude-plugin" / "plugin.json"
-    if not plugin_json_path.exists():
-        return None
-
-    data = load_json(plugin_json_path)
-    if data is None:
-        return None
-
-    return data.get("version")
+from _sync_lib import load_json, load_marketplace_json, locate_plugins, read_plugin_versions, save_json
 
 
 def sync_versions(
-    marketplace_path: Path, dry_run: bool = False, verbose: bool = True
+    marketplace_path: Path,
+    dry_run: bool = False,
+    verbose: bool = True,
+    marketplace_data: dict[str, Any] | None = None,
 ) -> tuple[bool, list[str]]:
     """
     Sync plugin versions from plugin sources (URL-based or path-based) to marketplace.json.
@@ -78,6 +36,7 @@ def sync_versions(
         marketplace_path: Path to marketplace.json
         dry_run: If True, don't write changes
         verbose: If True, print progress
+        marketplace_data: Already-loaded contents of marketplace_path, if any
 
     Returns:
         Tuple of (success, list of updated plugin names)
@@ -87,9 +46,10 @@ def sync_versions(
         marketplace_dir = marketplace_path.parent.parent
 
     # Load marketplace.json
-    marketplace_data = load_json(marketplace_path)
     if marketplace_data is None:
-        return False, []
+        marketplace_data = load_json(marketplace_path)
+        if marketplace_data is None:
+            return False, []
 
     plugins = marketplace_data.get("plugins", [])
     if not plugins:
@@ -97,35 +57,24 @@ def sync_versions(
             print("No plugins found in marketplace.json")
         return True, []
 
+    targets = locate_plugins(marketplace_dir, plugins)
+    versions = read_plugin_versions(
+        marketplace_dir, [plugin_dir for _, plugin_dir, found in targets if found], "sync-marketplace-versions-cache"
+    )
+
     updated_plugins: list[str] = []
     changes_made = False
 
-    for plugin in plugins:
-        plugin_name = plugin.get("name", "")
-        if not plugin_name:
-            continue
-
-        # Determine plugin directory from source
-        source = plugin.get("source", f"./{plugin_name}")
-        if isinstance(source, str) and source.startswith("./"):
-            # Path-based source (legacy): plugin dir is relative to marketplace
-            plugin_dir = marketplace_dir / source[2:]
-        elif isinstance(source, dict) and source.get("source") in ("github", "url"):
-            # URL-based source: look in OUTPUT_SKILLS/ for local dev copy
-            plugin_dir = marketplace_dir / "OUTPUT_SKILLS" / plugin_name
-            if not plugin_dir.exists():
-                # Also try parent's OUTPUT_SKILLS (if marketplace_dir is a subdirectory)
-                plugin_dir = marketplace_dir.parent / "OUTPUT_SKILLS" / plugin_name
-        else:
-            plugin_dir = marketplace_dir / plugin_name
+    for plugin, plugin_dir, found in targets:
+        plugin_name = plugin["name"]
 
-        if not plugin_dir.exists():
+        if not found:
             if verbose:
                 print(f"  [SKIP] {plugin_name}: directory not found at {plugin_dir}")
             continue
 
-        # Get version from plugin.json
-        actual_version = get_plugin_version(plugin_dir)
+        # Get version from the plugin's manifest
+        actual_version = versions[plugin_dir]
         if actual_version is None:
             if verbose:
                 print(f"  [SKIP] {plugin_name}: could not read version")
@@ -175,16 +124,19 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    # Find marketplace.json
+    # Find marketplace.json (auto-detection loads it in the same pass)
+    marketplace_data = None
     if args.marketplace:
         marketplace_path = args.marketplace
     else:
-        marketplace_path = find_marketplace_json(Path.cwd())
-
-    if marketplace_path is None:
-        print("Error: Could not find marketplace.json", file=sys.stderr)
-        print("Use --marketplace to specify the path", file=sys.stderr)
-        return 1
+        found = load_marketplace_json(Path.cwd())
+        if found is None:
+            print("Error: Could not find marketplace.json", file=sys.stderr)
+            print("Use --marketplace to specify the path", file=sys.stderr)
+            return 1
+        marketplace_path, marketplace_data = found
+        if marketplace_data is None:
+            return 1
 
     if not args.quiet:
         print(f"Syncing versions in {marketplace_path}")
@@ -192,7 +144,10 @@ def main() -> int:
             print("(dry run - no changes will be made)")
 
     success, updated = sync_versions(
-        marketplace_path, dry_run=args.dry_run, verbose=not args.quiet
+        marketplace_path,
+        dry_run=args.dry_run,
+        verbose=not args.quiet,
+        marketplace_data=marketplace_data,
     )
 
     if not success: